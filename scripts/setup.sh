@@ -115,18 +115,18 @@ fi
 # Build initial index
 echo ""
 echo "🔍 Building search index..."
-if [ -f "tools/memory-search-simple.py" ]; then
+if [ -f "tools/memory-search-simple.py" ] && [ -f "tools/memory_search_simple.py" ]; then
     python3 tools/memory-search-simple.py --index
     echo "✓ Search index built"
 else
-    echo "⚠️  memory-search-simple.py not found in tools/"
-    echo "   Copy it from the repo to tools/ directory"
+    echo "⚠️  memory-search-simple.py or memory_search_simple.py not found in tools/"
+    echo "   Copy both from the repo to tools/ directory"
 fi
 
 # Test search
 echo ""
 echo "🧪 Testing search..."
-if [ -f "tools/memory-search-simple.py" ]; then
+if [ -f "tools/memory-search-simple.py" ] && [ -f "tools/memory_search_simple.py" ]; then
     echo ""
     python3 tools/memory-search-simple.py "Memex" --format index --limit 3
     echo ""
@@ -15,23 +15,203 @@ Usage:
     python memory-compress.py --file conversation.md
     python memory-compress.py --session-id agent:main:abc123
     python memory-compress.py --interactive
+
+Extraction patterns are compiled with RE2 (google-re2 / pyre2) when it is
+installed: its DFA matcher runs in linear time, so lazy quantifiers such as
+`.{10,150}?` cannot backtrack catastrophically on large or pathological
+conversations. Without it the stdlib `re` module is used and results are the
+same apart from that worst-case guarantee.
 """
 
+from __future__ import annotations
+
+import atexit
 import os
 import sys
 import json
+import mmap
 import re
-import argparse
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Memory system paths
 MEMORY_DIR = Path(os.getenv("MEMEX_WORKSPACE", Path.cwd())) / "memory"
 COMPRESSION_LOG = Path(os.getenv("MEMEX_WORKSPACE", Path.cwd())) / "tools" / "compression.log"
 
-@dataclass
+# Files under this size (~1000 tokens at ~4 bytes per token) are not worth
+# compressing and get a preview-only result
+SMALL_FILE_BYTES = 4000
+
+# Daily notes are named <prefix>MM-DD.md; override to pick up other years
+DAILY_FILE_PREFIX = os.getenv("MEMEX_DAILY_PREFIX", "2026-")
+
+
+def _compile(pattern: str, flags: int = 0):
+    """Compile an extraction pattern, preferring RE2 when available."""
+    if re2 is not None:
+        # RE2 bindings differ in how they take flags; inline them instead
+        inline = ''.join(c for f, c in ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm')) if flags & f)
+        try:
+            return re2.compile(f'(?{inline}){pattern}' if inline else pattern)
+        except re2.error:
+            pass  # Feature RE2 lacks (e.g. lookahead) - use the stdlib engine
+    return re.compile(pattern, flags)
+
+
+def _json_bytes(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+# Tokenizer is loaded on first use; False means tiktoken is unavailable
+_ENCODER = None
+
+
+def _count_tokens(text: str) -> int:
+    """Count tokens with tiktoken (cl100k_base), else estimate ~4 chars per token."""
+    global _ENCODER
+    if _ENCODER is None:
+        try:
+            import tiktoken
+            _ENCODER = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            # Not installed, or the encoding file can't be fetched offline
+            _ENCODER = False
+    
+    if _ENCODER is False:
+        return len(text) // 4
+    return len(_ENCODER.encode(text, disallowed_special=()))
+
+
+def _token_estimator() -> str:
+    """Name of the method behind the last _count_tokens() results."""
+    return 'tiktoken:cl100k_base' if _ENCODER else 'chars/4'
+
+
+# Extraction patterns, compiled once at import
+_SECTION_SPLIT = re.compile(r'\n(?=#{1,3}\s)')
+_SEGMENT_SPLIT_RE = re.compile(r'\n\n+|\n#{1,3}\s')
+_BULLET_RE = _compile(r'^[\s]*[-*]\s+(.+)$', re.MULTILINE)
+_EMPHASIS_RE = _compile(r'\*\*(.+?)\*\*|__(.+?)__')
+_PROPER_NOUN_RE = _compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+# Header keywords that mark a section as a key point, matched against the
+# lowercased header in a single search
+IMPORTANT_HEADER_KEYWORDS = (
+    'decision', 'action', 'plan', 'goal', 'outcome',
+    'result', 'learned', 'lesson', 'insight', 'conclusion',
+    'summary', 'next', 'priority', 'important', 'key'
+)
+_IMPORTANT_HEADER_RE = _compile('|'.join(IMPORTANT_HEADER_KEYWORDS))
+
+# Entity extraction vocabularies
+COMMON_WORDS = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'I', 'We', 'You', 'It', 'He', 'She', 'They'}
+TECH_TERMS = {'Claude', 'GPT', 'AI', 'API', 'CLI', 'Git', 'GitHub', 'Python', 'JavaScript', 'Docker', 'Kubernetes'}
+
+# Fallback without pyahocorasick: case-insensitive substring search per term,
+# so the document never has to be lowercased into a second full-size copy.
+# Terms are tried longest first; once one is found, the shorter terms it
+# contains (Git inside GitHub) are known to be present without a search.
+_TECH_TERM_PATTERNS = tuple(
+    (
+        term,
+        _compile(re.escape(term), re.IGNORECASE),
+        frozenset(t for t in TECH_TERMS if t != term and t.lower() in term.lower()),
+    )
+    for term in sorted(TECH_TERMS, key=lambda t: (-len(t), t))
+)
+
+
+def _build_automaton(words):
+    """Build an Aho-Corasick automaton over lowercased words, if available."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in words:
+        automaton.add_word(word.lower(), word)
+    automaton.make_automaton()
+    return automaton
+
+
+# With pyahocorasick installed every keyword is found in one pass over the
+# text, overlapping matches included (e.g. both "Git" and "GitHub")
+_IMPORTANT_HEADER_AC = _build_automaton(IMPORTANT_HEADER_KEYWORDS)
+_TECH_TERM_AC = _build_automaton(TECH_TERMS)
+
+# The automaton matches lowercased text, so content is lowercased one
+# window at a time rather than as a full-size copy; windows overlap by one
+# character less than the longest term so no match is split between two
+_TECH_TERM_WINDOW = 1 << 16
+_TECH_TERM_OVERLAP = max(len(term) for term in TECH_TERMS) - 1
+
+
+def _is_important_header(header: str) -> bool:
+    """Check a lowercased section header for key-point keywords."""
+    if _IMPORTANT_HEADER_AC is not None:
+        return next(_IMPORTANT_HEADER_AC.iter(header), None) is not None
+    return _IMPORTANT_HEADER_RE.search(header) is not None
+
+
+def _find_tech_terms(content: str) -> set:
+    """Return the known tech terms mentioned anywhere in content."""
+    if _TECH_TERM_AC is not None:
+        found = set()
+        for start in range(0, len(content), _TECH_TERM_WINDOW):
+            window = content[start:start + _TECH_TERM_WINDOW + _TECH_TERM_OVERLAP].lower()
+            found.update(term for _, term in _TECH_TERM_AC.iter(window))
+        return found
+    found = set()
+    for term, pattern, implied in _TECH_TERM_PATTERNS:
+        if term not in found and pattern.search(content):
+            found.add(term)
+            found.update(implied)
+    return found
+
+# Action items and decisions are extracted in one tagged pass: every
+# alternative captures into its own named group, match.lastgroup says which
+# one fired, and _ACTION_GROUPS tells the two families apart.
+_ACTION_PATTERNS = [
+    r'(?:TODO|todo|To do|TO DO)[\s:>-]+(?P<todo>.+?)(?:\n|$)',
+    r'(?:ACTION|Action)[\s:>-]+(?P<action>.+?)(?:\n|$)',
+    r'(?:need to|needs to|should|must|will)\s+(?P<need>.{10,150}?)(?:\.|\n|$)',
+    r'(?:\[ \]|\[x\])\s*(?P<checkbox>.+?)(?:\n|$)',
+    r'(?:next step|follow up|follow-up)[\s:>-]+(?P<next>.+?)(?:\.|\n|$)',
+]
+_ACTION_GROUPS = frozenset({'todo', 'action', 'need', 'checkbox', 'next'})
+
+_DECISION_PATTERNS = [
+    r'(?:decided|decision)[\s:>-]+(?P<decided>.{10,200}?)(?:\.|\n|$)',
+    r"(?:we will|I will|let's|lets)\s+(?P<will>.{10,200}?)(?:\.|\n|$)",
+    r'(?:going to|plan to)\s+(?P<plan>.{10,200}?)(?:\.|\n|$)',
+    r'(?:agreed|agreement)[\s:>-]+(?P<agreed>.{10,200}?)(?:\.|\n|$)',
+]
+
+_ITEM_RE = _compile('|'.join(_ACTION_PATTERNS + _DECISION_PATTERNS), re.IGNORECASE)
+
+# slots=True needs Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class CompressionResult:
     """Result of compressing a session."""
     original_tokens: int
@@ -42,38 +222,59 @@ class CompressionResult:
     entities_mentioned: List[str]
     timestamp: str
     source: str
+    # Size of the input in characters and how original_tokens was counted,
+    # since tiktoken counts and the ~4 chars/token estimate are not comparable
+    original_chars: int = 0
+    token_estimator: str = 'chars/4'
 
 
 class SessionCompressor:
     """Compress long sessions into searchable summaries."""
     
     def __init__(self):
-        self.compression_patterns = {
-            'greeting': r"^(hi|hello|hey|good morning|good evening|what's up)[,!]?\s*",
-            'acknowledgment': r"^(got it|ok|okay|sure|thanks|thank you)[.!]?\s*",
-            ' filler': r"\b(um|uh|like|you know|so yeah|i mean)\b",
-        }
+        # Compression log handle, opened on first save and kept for the run
+        self._log_fh = None
+    
+    def close(self):
+        """Flush and close the compression log."""
+        if self._log_fh is not None:
+            self._log_fh.close()
+            self._log_fh = None
     
     def compress_file(self, file_path: Path, max_length: int = 50000) -> CompressionResult:
-        """Compress a memory file into a summary."""
+        """Compress a memory file into a summary.
+        
+        Files under SMALL_FILE_BYTES or 1000 tokens only get a preview. With
+        tiktoken installed the token threshold uses real counts, otherwise
+        the ~4 chars/token estimate, so where it falls depends on which one
+        is available.
+        """
         
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
-        content = file_path.read_text(encoding='utf-8')
+        # Files this small are never compressed; the minimal result only
+        # needs the head of the file, so skip reading the rest
+        size = file_path.stat().st_size
+        if size < SMALL_FILE_BYTES:
+            with open(file_path, encoding='utf-8') as f:
+                head = f.read(501)  # One past the preview length, for the "..."
+            # Byte size stands in for length; notes are mostly ASCII
+            return self._create_minimal_result(head, size // 4, str(file_path), size, 'chars/4')
         
-        # Estimate tokens (rough approximation: ~4 chars per token)
-        original_tokens = len(content) // 4
+        content = self._read_file(file_path)
+        
+        original_tokens = _count_tokens(content)
         
         # If file is small enough, don't compress
         if original_tokens < 1000:
-            return self._create_minimal_result(content, original_tokens, str(file_path))
+            return self._create_minimal_result(content, original_tokens, str(file_path),
+                                               len(content), _token_estimator())
         
         # Extract structured information
         sections = self._extract_sections(content)
         key_points = self._extract_key_points(sections)
-        action_items = self._extract_action_items(content)
-        decisions = self._extract_decisions(content)
+        action_items, decisions = self._extract_items(content)
         entities = self._extract_entities(content)
         
         # Generate summary
@@ -87,25 +288,93 @@ class SessionCompressor:
             decisions=decisions[:10],
             entities_mentioned=entities[:15],
             timestamp=datetime.now().isoformat(),
-            source=str(file_path)
+            source=str(file_path),
+            original_chars=len(content),
+            token_estimator=_token_estimator()
         )
     
+    def compress_files(self, files: List[Path]) -> Iterator[Tuple[Path, Optional[CompressionResult], Optional[Exception]]]:
+        """Compress several files in parallel worker processes.
+        
+        A single file, or a system where the process pool can't start, is
+        compressed in this process instead.
+        
+        Yields (file_path, result, error) in input order, with exactly one of
+        result/error set. Saving is left to the caller so outputs and the
+        compression log are only ever written from this process.
+        """
+        if not files:
+            return
+        
+        futures = None
+        if len(files) > 1:
+            # Only batch runs pay for the multiprocessing import
+            from concurrent.futures import ProcessPoolExecutor
+            
+            workers = min(len(files), os.cpu_count() or 1)
+            executor = None
+            try:
+                executor = ProcessPoolExecutor(max_workers=workers)
+                futures = [executor.submit(_compress_one_file, f) for f in files]
+            except (OSError, NotImplementedError, ImportError):
+                # No usable process support here (e.g. a sandbox without
+                # /dev/shm); compress the batch in this process instead
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+                futures = None
+        
+        if futures is None:
+            for file_path in files:
+                try:
+                    yield file_path, self.compress_file(file_path), None
+                except Exception as e:
+                    yield file_path, None, e
+            return
+        
+        with executor:
+            for file_path, future in zip(files, futures):
+                try:
+                    yield file_path, future.result(), None
+                except Exception as e:
+                    yield file_path, None, e
+    
+    def _read_file(self, file_path: Path) -> str:
+        """Read a memory file, decoding straight from a read-only mapping.
+        
+        Decoding from the mmap skips the intermediate bytes copy that
+        read_text() keeps alive alongside the decoded string.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = str(mm, 'utf-8')
+        
+        # Match the universal-newline handling of text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def compress_text(self, text: str, source: str = "unknown") -> CompressionResult:
-        """Compress raw text content."""
+        """Compress raw text content.
         
-        original_tokens = len(text) // 4
+        Text under 500 tokens only gets a preview; like compress_file's
+        threshold, this counts with tiktoken when it is installed.
+        """
+        
+        original_tokens = _count_tokens(text)
         
         if original_tokens < 500:
-            return self._create_minimal_result(text, original_tokens, source)
+            return self._create_minimal_result(text, original_tokens, source,
+                                               len(text), _token_estimator())
         
         # Split into segments by headers or double newlines
-        segments = re.split(r'\n\n+|\n#{1,3}\s', text)
+        segments = _SEGMENT_SPLIT_RE.split(text)
         segments = [s.strip() for s in segments if len(s.strip()) > 50]
         
         # Extract information
         key_points = self._extract_key_points_from_segments(segments)
-        action_items = self._extract_action_items(text)
-        decisions = self._extract_decisions(text)
+        action_items, decisions = self._extract_items(text)
         entities = self._extract_entities(text)
         
         summary = self._generate_summary_from_segments(segments, key_points)
@@ -118,10 +387,13 @@ class SessionCompressor:
             decisions=decisions[:10],
             entities_mentioned=entities[:15],
             timestamp=datetime.now().isoformat(),
-            source=source
+            source=source,
+            original_chars=len(text),
+            token_estimator=_token_estimator()
         )
     
-    def _create_minimal_result(self, content: str, tokens: int, source: str) -> CompressionResult:
+    def _create_minimal_result(self, content: str, tokens: int, source: str,
+                               chars: int, estimator: str) -> CompressionResult:
         """Create a minimal result for short content."""
         return CompressionResult(
             original_tokens=tokens,
@@ -131,7 +403,9 @@ class SessionCompressor:
             decisions=[],
             entities_mentioned=[],
             timestamp=datetime.now().isoformat(),
-            source=source
+            source=source,
+            original_chars=chars,
+            token_estimator=estimator
         )
     
     def _extract_sections(self, content: str) -> List[Dict]:
@@ -139,21 +413,18 @@ class SessionCompressor:
         sections = []
         
         # Split by headers
-        pattern = r'\n(?=#{1,3}\s)'
-        parts = re.split(pattern, content)
+        parts = _SECTION_SPLIT.split(content)
         
         for part in parts:
             if not part.strip():
                 continue
             
-            lines = part.split('\n')
-            header = lines[0].strip() if lines else ""
-            body = '\n'.join(lines[1:]).strip()
+            # Slice at the first newline rather than splitting every line
+            header, _, body = part.partition('\n')
             
             sections.append({
-                'header': header,
-                'body': body,
-                'length': len(body)
+                'header': header.strip(),
+                'body': body.strip()
             })
         
         return sections
@@ -167,25 +438,19 @@ class SessionCompressor:
             body = section['body']
             
             # Important headers indicate key points
-            important_patterns = [
-                r'decision', r'action', r'plan', r'goal', r'outcome',
-                r'result', r'learned', r'lesson', r'insight', r'conclusion',
-                r'summary', r'next', r'priority', r'important', r'key'
-            ]
-            
-            if any(re.search(p, header) for p in important_patterns):
+            if _is_important_header(header):
                 # Extract the main point
-                first_sentence = body.split('.')[0] if body else header
+                first_sentence = body.partition('.')[0] if body else header
                 point = f"{header}: {first_sentence[:200]}"
                 key_points.append(point)
             
-            # Look for bullet points
-            bullets = re.findall(r'^[\s]*[-*]\s+(.+)$', body, re.MULTILINE)
-            for bullet in bullets[:3]:  # Limit bullets per section
+            # Look for bullet points, scanning only as far as the first three
+            for match in islice(_BULLET_RE.finditer(body), 3):  # Limit bullets per section
+                bullet = match.group(1)
                 if len(bullet) > 20 and len(bullet) < 300:
                     key_points.append(bullet)
         
-        return list(set(key_points))  # Deduplicate
+        return list(dict.fromkeys(key_points))  # Deduplicate, keeping document order
     
     def _extract_key_points_from_segments(self, segments: List[str]) -> List[str]:
         """Extract key points from text segments."""
@@ -193,82 +458,54 @@ class SessionCompressor:
         
         for segment in segments[:10]:  # Limit segments
             # First sentence often contains the key point
-            sentences = segment.split('.')
-            if sentences:
-                first = sentences[0].strip()
-                if len(first) > 30 and len(first) < 300:
-                    key_points.append(first)
+            first = segment.partition('.')[0].strip()
+            if len(first) > 30 and len(first) < 300:
+                key_points.append(first)
             
             # Look for emphasis markers
-            emphasized = re.findall(r'\*\*(.+?)\*\*|__(.+?)__', segment)
-            for match in emphasized[:3]:
-                text = match[0] or match[1]
+            for match in islice(_EMPHASIS_RE.finditer(segment), 3):
+                text = match.group(match.lastindex)  # Whichever of **...** / __...__ matched
                 if len(text) > 10:
                     key_points.append(text)
         
-        return list(set(key_points))
+        return list(dict.fromkeys(key_points))
     
-    def _extract_action_items(self, content: str) -> List[str]:
-        """Extract action items and todos."""
-        action_items = []
-        
-        # Patterns for action items
-        patterns = [
-            r'(?:TODO|todo|To do|TO DO)[\s:>-]+(.+?)(?:\n|$)',
-            r'(?:ACTION|Action)[\s:>-]+(.+?)(?:\n|$)',
-            r'(?:need to|needs to|should|must|will)\s+(.{10,150}?)(?:\.|\n|$)',
-            r'(?:\[ \]|\[x\])\s*(.+?)(?:\n|$)',  # Checkboxes
-            r'(?:next step|follow up|follow-up)[\s:>-]+(.+?)(?:\.|\n|$)',
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                item = match.strip()
-                if len(item) > 10 and len(item) < 200:
-                    action_items.append(item)
-        
-        return list(set(action_items))[:10]
-    
-    def _extract_decisions(self, content: str) -> List[str]:
-        """Extract decisions made."""
-        decisions = []
-        
-        patterns = [
-            r'(?:decided|decision)[\s:>-]+(.{10,200}?)(?:\.|\n|$)',
-            r'(?:we will|I will|let\'s|lets)\s+(.{10,200}?)(?:\.|\n|$)',
-            r'(?:going to|plan to)\s+(.{10,200}?)(?:\.|\n|$)',
-            r'(?:agreed|agreement)[\s:>-]+(.{10,200}?)(?:\.|\n|$)',
-        ]
+    def _extract_items(self, content: str, cap: int = 10) -> Tuple[List[str], List[str]]:
+        """Extract action items and decisions in a single pass.
         
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            for match in matches:
-                decision = match.strip()
-                if len(decision) > 10:
-                    decisions.append(decision)
+        Each family is deduplicated in document order and capped at `cap`;
+        the scan stops as soon as both are full.
+        """
+        action_items = {}
+        decisions = {}
+        
+        for match in _ITEM_RE.finditer(content):
+            text = match.group(match.lastgroup).strip()
+            if match.lastgroup in _ACTION_GROUPS:
+                if len(text) > 10 and len(text) < 200 and len(action_items) < cap:
+                    action_items[text] = None
+            elif len(text) > 10 and len(decisions) < cap:
+                decisions[text] = None
+            
+            if len(action_items) >= cap and len(decisions) >= cap:
+                break
         
-        return list(set(decisions))[:10]
+        return list(action_items), list(decisions)
     
     def _extract_entities(self, content: str) -> List[str]:
         """Extract mentioned entities (people, projects, tools)."""
         entities = set()
         
         # Look for capitalized terms (potential proper nouns)
-        proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', content)
+        proper_nouns = _PROPER_NOUN_RE.findall(content)
         
         # Filter for likely entities
-        common_words = {'The', 'A', 'An', 'This', 'That', 'These', 'Those', 'I', 'We', 'You', 'It', 'He', 'She', 'They'}
-        tech_terms = {'Claude', 'GPT', 'AI', 'API', 'CLI', 'Git', 'GitHub', 'Python', 'JavaScript', 'Docker', 'Kubernetes'}
-        
         for noun in proper_nouns:
-            if noun not in common_words and len(noun) > 2:
+            if noun not in COMMON_WORDS and len(noun) > 2:
                 entities.add(noun)
         
         # Add known tech terms if mentioned
-        for term in tech_terms:
-            if term.lower() in content.lower():
-                entities.add(term)
+        entities.update(_find_tech_terms(content))
         
         return sorted(list(entities))[:15]
     
@@ -293,7 +530,7 @@ class SessionCompressor:
         summary_parts = []
         
         for segment in segments[:3]:
-            first_line = segment.split('\n')[0][:100]
+            first_line = segment.partition('\n')[0][:100]
             if first_line:
                 summary_parts.append(first_line)
         
@@ -317,16 +554,17 @@ class SessionCompressor:
             'timestamp': result.timestamp,
             'source': result.source,
             'original_tokens': result.original_tokens,
+            'token_estimator': result.token_estimator,
             'summary': result.summary,
             'key_points': result.key_points,
             'action_items': result.action_items,
             'decisions': result.decisions,
             'entities_mentioned': result.entities_mentioned,
-            'compression_ratio': len(result.summary) / (result.original_tokens * 4) if result.original_tokens > 0 else 1.0
+            # Characters out per character in, whichever way tokens were counted
+            'compression_ratio': len(result.summary) / result.original_chars if result.original_chars > 0 else 1.0
         }
         
-        with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+        output_path.write_bytes(_json_bytes(data, indent=True))
         
         # Log compression
         self._log_compression(result, output_path)
@@ -345,8 +583,35 @@ class SessionCompressor:
         }
         
         # Append to log
-        with open(COMPRESSION_LOG, 'a') as f:
-            f.write(json.dumps(log_entry) + '\n')
+        # One buffered append handle per compressor, so batch runs don't pay
+        # an open/close per file; flushed when the process exits
+        if self._log_fh is None:
+            self._log_fh = open(COMPRESSION_LOG, 'ab', buffering=1 << 16)
+            atexit.register(self.close)
+        self._log_fh.write(_json_bytes(log_entry) + b'\n')
+
+
+def _recent_memory_files(limit: int) -> List[Path]:
+    """Return up to limit daily memory files, newest modification first.
+    
+    Uses a single os.scandir pass; DirEntry caches the stat result, so each
+    file costs one syscall instead of a glob match plus a separate stat().
+    """
+    if not MEMORY_DIR.exists():
+        return []
+    
+    with os.scandir(MEMORY_DIR) as it:
+        entries = [
+            (e.stat().st_mtime, e.path) for e in it
+            if e.name.startswith(DAILY_FILE_PREFIX) and e.name.endswith('.md') and e.is_file()
+        ]
+    entries.sort(reverse=True)
+    return [Path(path) for _, path in entries[:limit]]
+
+
+def _compress_one_file(file_path: Path) -> CompressionResult:
+    """Worker entry point for SessionCompressor.compress_files."""
+    return SessionCompressor().compress_file(file_path)
 
 
 class InteractiveCompressor:
@@ -400,12 +665,7 @@ class InteractiveCompressor:
     
     def _get_recent_memory_files(self, limit: int = 10) -> List[Path]:
         """Get recent memory files sorted by date."""
-        if not MEMORY_DIR.exists():
-            return []
-        
-        files = [f for f in MEMORY_DIR.glob("2026-*.md") if f.is_file()]
-        files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-        return files[:limit]
+        return _recent_memory_files(limit)
     
     def _compress_single(self, file_path: Path):
         """Compress a single file."""
@@ -436,9 +696,10 @@ class InteractiveCompressor:
         """Compress all files."""
         print(f"\nCompressing {len(files)} files...")
         
-        for file_path in files:
+        for file_path, result, error in self.compressor.compress_files(files):
             try:
-                result = self.compressor.compress_file(file_path)
+                if error is not None:
+                    raise error
                 output_path = self.compressor.save_compressed(result)
                 print(f"  ✅ {file_path.name} → {output_path.name}")
             except Exception as e:
@@ -451,15 +712,8 @@ class InteractiveCompressor:
         print("\nPaste text to compress (Ctrl+D when done):")
         print("-" * 50)
         
-        lines = []
-        try:
-            while True:
-                line = input()
-                lines.append(line)
-        except EOFError:
-            pass
-        
-        text = '\n'.join(lines)
+        # One read up to EOF instead of an input() call per line
+        text = sys.stdin.read()
         
         if not text.strip():
             print("No text provided.")
@@ -474,6 +728,8 @@ class InteractiveCompressor:
 
 
 def main():
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Compress long conversations into searchable summaries",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -505,11 +761,12 @@ Examples:
         print(f"📁 Saved: {output_path}")
         print(f"\nSummary:\n{result.summary}")
     elif args.recent:
-        files = sorted(MEMORY_DIR.glob("2026-*.md"), key=lambda f: f.stat().st_mtime, reverse=True)[:args.recent]
+        files = _recent_memory_files(args.recent)
         print(f"Compressing {len(files)} recent files...")
-        for f in files:
+        for f, result, error in compressor.compress_files(files):
             try:
-                result = compressor.compress_file(f)
+                if error is not None:
+                    raise error
                 compressor.save_compressed(result)
                 print(f"  ✅ {f.name}")
             except Exception as e:
@@ -11,28 +11,37 @@ Usage:
 
 import argparse
 import json
+import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 
-# Import search function using importlib (handles hyphenated filenames)
-import os
-import sys
-import importlib.util
+from memory_search_simple import SimpleMemorySearcher
+
+# Daily-note events are their h2+ headings
+_HEADING_RE = re.compile(r'^##[^\n]*', re.MULTILINE)
 
-# Load memory-search-simple module
-SCRIPT_DIR = Path(__file__).parent.absolute()
-search_module_path = SCRIPT_DIR / "memory-search-simple.py"
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-if not search_module_path.exists():
-    print(f"⚠️  memory-search-simple.py not found in {SCRIPT_DIR}", file=sys.stderr)
-    sys.exit(1)
 
-spec = importlib.util.spec_from_file_location("memory_search_simple", search_module_path)
-memory_search_simple = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(memory_search_simple)
+def _iter_items_files(root):
+    """Yield DirEntry objects for every items.json under root.
+    
+    scandir hands back cached type info, and each DirEntry caches its own
+    stat, so callers can check mtimes without an extra syscall per path.
+    """
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_items_files(entry.path)
+            elif entry.name == 'items.json':
+                yield entry
 
-SimpleMemorySearcher = memory_search_simple.SimpleMemorySearcher
 
 def get_timeline(memory_id=None, date=None, query=None, hours_before=24, hours_after=24):
     """
@@ -59,21 +68,22 @@ def get_timeline(memory_id=None, date=None, query=None, hours_before=24, hours_a
             print("❌ No index found. Run: python memory-search-simple.py --index", file=sys.stderr)
             return {}
         
-        for entry in searcher.indexer.entries:
-            if entry.id == clean_id:
-                anchor_context = {
-                    'content': entry.content,
-                    'metadata': {
-                        'source': entry.source,
-                        'timestamp': entry.timestamp
-                    }
+        table = searcher.indexer.table
+        rows = table.rows_by('ids').get(clean_id)
+        if rows is not None:
+            entry = table.entry(rows[0])
+            anchor_context = {
+                'content': entry.content,
+                'metadata': {
+                    'source': entry.source,
+                    'timestamp': entry.timestamp
                 }
-                if entry.timestamp and len(entry.timestamp) == 10:  # YYYY-MM-DD
-                    try:
-                        anchor_time = datetime.strptime(entry.timestamp, '%Y-%m-%d')
-                    except:
-                        pass
-                break
+            }
+            if entry.timestamp and len(entry.timestamp) == 10:  # YYYY-MM-DD
+                try:
+                    anchor_time = datetime.strptime(entry.timestamp, '%Y-%m-%d')
+                except:
+                    pass
     
     elif date:
         try:
@@ -115,34 +125,39 @@ def get_timeline(memory_id=None, date=None, query=None, hours_before=24, hours_a
                     with open(md_file, 'r') as f:
                         content = f.read()
                         # Extract headings as events
-                        for line in content.split('\n'):
-                            if line.startswith('##'):
-                                timeline_events.append({
-                                    'date': file_date,
-                                    'type': 'daily_note',
-                                    'event': line.strip('# '),
-                                    'file': str(md_file)
-                                })
+                        for m in _HEADING_RE.finditer(content):
+                            timeline_events.append({
+                                'date': file_date,
+                                'type': 'daily_note',
+                                'event': m.group().strip('# '),
+                                'file': str(md_file)
+                            })
     
     # Knowledge graph updates (check modification times)
     kg_dir = Path.home() / 'life' / 'areas'
     if kg_dir.exists():
-        for items_file in kg_dir.rglob('items.json'):
-            mtime = datetime.fromtimestamp(items_file.stat().st_mtime)
-            if anchor_time - timedelta(hours=hours_before) <= mtime <= anchor_time + timedelta(hours=hours_after):
-                try:
-                    with open(items_file, 'r') as f:
-                        items = json.load(f)
-                        for item in items[-5:]:  # Last 5 items
-                            timeline_events.append({
-                                'date': item.get('timestamp', ''),
-                                'type': 'knowledge_graph',
-                                'event': item.get('fact', ''),
-                                'file': str(items_file),
-                                'entity': items_file.parent.name
-                            })
-                except:
-                    pass
+        window_start = (anchor_time - timedelta(hours=hours_before)).timestamp()
+        window_end = (anchor_time + timedelta(hours=hours_after)).timestamp()
+        for dir_entry in _iter_items_files(kg_dir):
+            # Only files modified inside the window are worth parsing
+            if not window_start <= dir_entry.stat().st_mtime <= window_end:
+                continue
+            items_file = Path(dir_entry.path)
+            try:
+                items = _json_loads(items_file.read_bytes())
+                # Handle both list and dict formats
+                if isinstance(items, dict):
+                    items = items.get('items', [])
+                for item in items[-5:]:  # Last 5 items
+                    timeline_events.append({
+                        'date': item.get('timestamp', ''),
+                        'type': 'knowledge_graph',
+                        'event': item.get('fact', ''),
+                        'file': str(items_file),
+                        'entity': items_file.parent.name
+                    })
+            except:
+                pass
     
     # Sort by date (handle both string dates and unix timestamps)
     def sort_key(event):
@@ -15,26 +15,266 @@ Usage:
 
 import os
 import sys
+import gzip
+import hashlib
 import json
+import re
+import tempfile
+import time
 import argparse
+import threading
+from types import SimpleNamespace
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
-import mimetypes
+from typing import Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qsl, urlparse
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
 try:
-    from memory_search import MemorySearcher, MemoryIndexer, CHROMA_PATH
+    from memory_search import MemorySearcher, CHROMA_PATH
 except ImportError:
+    MemorySearcher = None
     CHROMA_PATH = Path("/home/Gabe/clawd/tools/memory/vector_store")
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Memory system paths
 MEMORY_DIR = Path(os.getenv("MEMEX_WORKSPACE", Path.cwd())) / "memory"
 LIFE_AREAS_DIR = Path.home() / "life" / "areas"
 TOOLS_DIR = Path(os.getenv("MEMEX_WORKSPACE", Path.cwd())) / "tools"
 
+# Daily notes are named <prefix>MM-DD.md; override to pick up other years
+DAILY_FILE_PREFIX = os.getenv("MEMEX_DAILY_PREFIX", "2026-")
+
+# Requests handled at once; further connections wait for a free slot
+MAX_CONCURRENT_REQUESTS = 32
+
+# JSON arrays longer than this are sent with chunked transfer encoding
+STREAM_MIN_ITEMS = 50
+STREAM_CHUNK_BYTES = 32 * 1024
+
+# Shared by all request threads; reads of a batch of files overlap on it
+IO_WORKERS = 8
+_IO_POOL = ThreadPoolExecutor(max_workers=IO_WORKERS)
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data).encode()
+
+
+def _map_ahead(fn, items: list, window: int = IO_WORKERS):
+    """Run fn over items on _IO_POOL, yielding (item, result) in order.
+    
+    Unlike Executor.map, at most `window` calls are queued ahead of the
+    consumer, so a caller that stops early leaves no work behind and only
+    a window's worth of results is held at once.
+    """
+    pending = deque()
+    try:
+        for item in items:
+            pending.append((item, _IO_POOL.submit(fn, item)))
+            if len(pending) >= window:
+                item, future = pending.popleft()
+                yield item, future.result()
+        while pending:
+            item, future = pending.popleft()
+            yield item, future.result()
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+
+def _read_bytes(path: Path) -> Optional[bytes]:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _read_files(paths: list):
+    """Read paths concurrently, yielding (path, bytes) in order.
+    
+    Unreadable files yield None in place of their content.
+    """
+    return _map_ahead(_read_bytes, paths)
+
+
+def _match_section(buf, pattern, heading):
+    """Slice the heading-delimited section of buf where pattern first matches."""
+    match = pattern.search(buf)
+    if not match:
+        return None
+    start = buf.rfind(heading, 0, match.start())
+    start = 0 if start == -1 else start + len(heading)
+    end = buf.find(heading, match.start())
+    return buf[start:] if end == -1 else buf[start:end]
+
+
+def _scan_file(path: Path, pattern, min_size: int = 0) -> Optional[str]:
+    """Return the '## ' section of a daily note where pattern first matches.
+    
+    A bytes pattern is matched on the raw file, so only the matching
+    section is ever decoded.
+    """
+    data = _read_bytes(path)
+    if not data or len(data) < min_size:
+        return None
+    if isinstance(pattern.pattern, bytes):
+        section = _match_section(data, pattern, b'\n## ')
+        return None if section is None else section.decode('utf-8', 'ignore')
+    return _match_section(data.decode('utf-8', 'ignore'), pattern, '\n## ')
+
+
+# /api/stats walks every items.json, so its result is reused for up to
+# STATS_TTL seconds unless one of the directories it counts has changed
+STATS_TTL = 10
+_stats_cache = None  # (monotonic time, directory mtimes, stats)
+
+
+# The vector store only changes on re-index, so its size is reused for a minute
+VECTOR_COUNT_TTL = 60
+_vector_count_cache = None  # (monotonic time, count)
+
+
+def _get_vector_count(searcher) -> int:
+    """Number of documents in the vector store, cached for VECTOR_COUNT_TTL."""
+    global _vector_count_cache
+    now = time.monotonic()
+    if _vector_count_cache and now - _vector_count_cache[0] < VECTOR_COUNT_TTL:
+        return _vector_count_cache[1]
+    count = searcher.collection.count()
+    _vector_count_cache = (now, count)
+    return count
+
+
+def _mtime_ns(path: Path):
+    """Directory mtime, or None if it doesn't exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+# Daily note paths, newest first, rebuilt when MEMORY_DIR's mtime changes
+_daily_index = {'mtime': None, 'files': []}
+
+
+def _get_daily_files() -> list:
+    """Sorted (newest first) daily note paths in MEMORY_DIR."""
+    mtime = _mtime_ns(MEMORY_DIR)
+    if mtime is None:
+        return []
+    if _daily_index['mtime'] != mtime:
+        files = sorted(
+            (p for p in MEMORY_DIR.iterdir()
+             if p.name.startswith(DAILY_FILE_PREFIX) and p.name.endswith('.md')),
+            reverse=True,
+        )
+        _daily_index['files'] = files
+        _daily_index['mtime'] = mtime
+    return _daily_index['files']
+
+
+class SearchCache:
+    """Thread-safe LRU cache of /api/search results.
+    
+    Entries expire after `ttl` seconds, so a re-indexed vector store shows
+    up without restarting the server.
+    """
+    
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached results for key, or None."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, results = item
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return results
+    
+    def put(self, key, results):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), results)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+_SEARCH_CACHE = SearchCache()
+
+
+class DailyNotes:
+    """Tracks per-note mtimes so cached fallback results can be keyed on them.
+    
+    refresh() is one stat per note; the generation is bumped whenever a
+    note is added, changed or removed, including appends that leave
+    MEMORY_DIR's own mtime alone.
+    """
+    
+    def __init__(self):
+        self.generation = 0
+        self._stamps = {}  # path -> mtime_ns
+        self._lock = threading.Lock()
+    
+    def refresh(self) -> int:
+        """Pick up changed notes and return the current generation."""
+        stamps = {}
+        for path in _get_daily_files():
+            try:
+                stamps[path] = path.stat().st_mtime_ns
+            except OSError:
+                pass
+        
+        with self._lock:
+            if stamps != self._stamps:
+                self._stamps = stamps
+                self.generation += 1
+            return self.generation
+
+
+def _create_searcher():
+    """Open the vector store once for the whole server; None if unavailable."""
+    if MemorySearcher is None:
+        return None
+    try:
+        searcher = MemorySearcher()
+        searcher._init_chroma()
+        return searcher
+    except Exception:
+        return None
+
 # HTML Template for the web interface
 HTML_TEMPLATE = '''
 <!DOCTYPE html>
@@ -438,19 +678,101 @@ HTML_TEMPLATE = '''
 </html>
 '''
 
+# The page never changes while the server runs: encode and compress it once
+_HTML_BYTES = HTML_TEMPLATE.encode('utf-8')
+_HTML_ENCODINGS = {'gzip': gzip.compress(_HTML_BYTES, 9)}
+if brotli is not None:
+    _HTML_ENCODINGS['br'] = brotli.compress(_HTML_BYTES, quality=11)
+
+# Each encoding is a different representation, so each gets its own strong
+# validator; keyed like _HTML_ENCODINGS, with None for uncompressed
+_html_digest = hashlib.blake2b(_HTML_BYTES, digest_size=8).hexdigest()
+_HTML_ETAGS = {None: '"%s"' % _html_digest}
+for _encoding in _HTML_ENCODINGS:
+    _HTML_ETAGS[_encoding] = '"%s-%s"' % (_html_digest, _encoding)
+
+
+def _accepted_encodings(header: str) -> set:
+    """Content codings an Accept-Encoding header allows (q > 0)."""
+    weights = {}
+    for token in header.split(','):
+        coding, _, params = token.partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(';'):
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    weight = float(value)
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    default = weights.get('*', 0.0)
+    return {coding for coding in _HTML_ENCODINGS if weights.get(coding, default) > 0}
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against etag."""
+    def opaque(tag):
+        tag = tag.strip()
+        return tag[2:] if tag.startswith('W/') else tag
+    
+    if header.strip() == '*':
+        return True
+    return any(opaque(tag) == etag for tag in header.split(','))
+
+
+def _spool(body: bytes):
+    """Copy body into an anonymous temp file that sendfile can read from."""
+    spooled = tempfile.TemporaryFile()
+    spooled.write(body)
+    spooled.flush()
+    return spooled
+
+
+# Each page variant as a file, so it goes kernel -> socket without a copy
+# through Python; keyed like _HTML_ENCODINGS, with None for uncompressed
+_HTML_FILES = {}
+if hasattr(os, 'sendfile'):
+    _HTML_FILES[None] = _spool(_HTML_BYTES)
+    for _encoding, _body in _HTML_ENCODINGS.items():
+        _HTML_FILES[_encoding] = _spool(_body)
+
+
+class MemoryWebServer(ThreadingHTTPServer):
+    """HTTP server carrying state shared by every request handler."""
+    
+    def __init__(self, server_address, handler_class, state: SimpleNamespace):
+        super().__init__(server_address, handler_class)
+        self.state = state
+        self.request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
 
 class MemoryWebHandler(BaseHTTPRequestHandler):
     """HTTP request handler for memory web interface."""
     
+    # Keep-alive and chunked responses need HTTP/1.1; idle connections
+    # are dropped after `timeout` seconds
+    protocol_version = 'HTTP/1.1'
+    timeout = 30
+    
     def log_message(self, format, *args):
         """Suppress default logging."""
         pass
     
     def do_GET(self):
         """Handle GET requests."""
+        # Threads are per connection; the semaphore caps how many do work
+        with self.server.request_slots:
+            self._route()
+    
+    def _route(self):
+        """Dispatch a GET request to its handler."""
         parsed = urlparse(self.path)
         path = parsed.path
-        query = parse_qs(parsed.query)
+        query = dict(parse_qsl(parsed.query))
         
         if path == '/' or path == '/index.html':
             self._serve_html()
@@ -464,34 +786,70 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
             self._serve_404()
     
     def _serve_html(self):
-        """Serve the main HTML page."""
+        """Serve the main HTML page, compressed when the client allows it."""
+        accepted = _accepted_encodings(self.headers.get('Accept-Encoding', ''))
+        encoding = next((e for e in ('br', 'gzip') if e in accepted), None)
+        etag = _HTML_ETAGS[encoding]
+        
+        if _etag_matches(self.headers.get('If-None-Match', ''), etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        body = _HTML_ENCODINGS[encoding] if encoding else _HTML_BYTES
+        
         self.send_response(200)
-        self.send_header('Content-Type', 'text/html')
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('Cache-Control', 'public, max-age=3600')
+        self.send_header('ETag', etag)
         self.end_headers()
-        self.wfile.write(HTML_TEMPLATE.encode())
+        
+        spooled = _HTML_FILES.get(encoding)
+        if spooled is not None:
+            self.connection.sendfile(spooled, 0, len(body))
+        else:
+            self.wfile.write(body)
     
     def _handle_search(self, query):
         """Handle search API requests."""
         try:
-            q = query.get('q', [''])[0]
-            limit = int(query.get('limit', ['10'])[0])
-            layer = query.get('layer', [None])[0]
+            q = query.get('q', '')
+            limit = int(query.get('limit', '10'))
+            layer = query.get('layer')
             
             if not q:
                 self._serve_json({'error': 'Query required'}, 400)
                 return
             
-            # Try to use memory_search module
-            try:
-                from memory_search import MemorySearcher
-                searcher = MemorySearcher()
-                results = searcher.search(
-                    query=q,
-                    limit=limit,
-                    layer=layer,
-                    format_output='detailed'
-                )
-            except Exception as e:
+            # Use the shared vector searcher when there is one. Its results
+            # are keyed on the exact query, since the backend may be
+            # case-sensitive; they only go stale on re-index, which the
+            # cache TTL covers
+            results = None
+            searcher = self.server.state.searcher
+            if searcher is not None:
+                cache_key = ('vector', q, limit, layer)
+                results = _SEARCH_CACHE.get(cache_key)
+                if results is None:
+                    try:
+                        results = searcher.search(
+                            query=q,
+                            limit=limit,
+                            layer=layer,
+                            format_output='detailed'
+                        )
+                    except Exception:
+                        results = None
+                    if results is not None:
+                        _SEARCH_CACHE.put(cache_key, results)
+            
+            if results is None:
                 # Fallback to simple file search
                 results = self._fallback_search(q, limit)
             
@@ -511,8 +869,8 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
     def _handle_memory_list(self, query):
         """Handle memory list API requests."""
         try:
-            layer = query.get('layer', [None])[0]
-            limit = int(query.get('limit', ['20'])[0])
+            layer = query.get('layer')
+            limit = int(query.get('limit', '20'))
             
             memories = self._list_memories(layer, limit)
             self._serve_json(memories)
@@ -522,37 +880,46 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
     
     def _fallback_search(self, query: str, limit: int) -> list:
         """Fallback search when vector DB not available."""
+        # Any added, edited or removed note bumps the generation, so an
+        # append to today's note is searchable straight away. The scan is
+        # case-insensitive, so case variants share an entry.
+        generation = self.server.state.daily_notes.refresh()
+        cache_key = ('file', query.lower(), limit, generation)
+        results = _SEARCH_CACHE.get(cache_key)
+        if results is not None:
+            return results
+        
         results = []
-        query_lower = query.lower()
+        # For ASCII queries a bytes pattern folds case the same way and can
+        # run on the raw file without decoding it
+        if query.isascii():
+            pattern = re.compile(re.escape(query.encode('ascii')), re.IGNORECASE)
+        else:
+            pattern = re.compile(re.escape(query), re.IGNORECASE)
         
         # Search memory files
         if MEMORY_DIR.exists():
-            for file_path in MEMORY_DIR.glob("2026-*.md"):
-                try:
-                    content = file_path.read_text(encoding='utf-8')
-                    if query_lower in content.lower():
-                        # Find the relevant section
-                        sections = content.split('\n## ')
-                        for section in sections:
-                            if query_lower in section.lower():
-                                results.append({
-                                    'id': 'file-' + file_path.stem,
-                                    'content': section[:500] + '...' if len(section) > 500 else section,
-                                    'metadata': {
-                                        'source': str(file_path),
-                                        'layer': 'daily',
-                                        'timestamp': self._extract_date(file_path.name)
-                                    },
-                                    'relevance': 0.8
-                                })
-                                break
-                        
-                        if len(results) >= limit:
-                            break
-                except:
-                    pass
+            candidates = _get_daily_files()
+            scan = partial(_scan_file, pattern=pattern, min_size=len(query))
+            for file_path, section in _map_ahead(scan, candidates):
+                if section is None:
+                    continue
+                results.append({
+                    'id': 'file-' + file_path.stem,
+                    'content': section[:500] + '...' if len(section) > 500 else section,
+                    'metadata': {
+                        'source': str(file_path),
+                        'layer': 'daily',
+                        'timestamp': self._extract_date(file_path.name)
+                    },
+                    'relevance': 0.8
+                })
+                
+                if len(results) >= limit:
+                    break
         
-        return results[:limit]
+        _SEARCH_CACHE.put(cache_key, results)
+        return results
     
     def _list_memories(self, layer: Optional[str], limit: int) -> list:
         """List memories from filesystem."""
@@ -560,7 +927,7 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
         
         if not layer or layer == 'daily':
             if MEMORY_DIR.exists():
-                for file_path in sorted(MEMORY_DIR.glob("2026-*.md"), reverse=True)[:limit]:
+                for file_path in _get_daily_files()[:limit]:
                     try:
                         content = file_path.read_text(encoding='utf-8')
                         memories.append({
@@ -578,6 +945,19 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
         return memories
     
     def _calculate_stats(self) -> dict:
+        """Return memory statistics, cached for STATS_TTL seconds."""
+        global _stats_cache
+        
+        key = tuple(_mtime_ns(d) for d in (MEMORY_DIR, MEMORY_DIR / "summaries", LIFE_AREAS_DIR))
+        now = time.monotonic()
+        if _stats_cache and now - _stats_cache[0] < STATS_TTL and _stats_cache[1] == key:
+            return _stats_cache[2]
+        
+        stats = self._compute_stats()
+        _stats_cache = (now, key, stats)
+        return stats
+    
+    def _compute_stats(self) -> dict:
         """Calculate memory statistics."""
         stats = {
             'total': 0,
@@ -587,18 +967,17 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
         
         # Count daily notes
         if MEMORY_DIR.exists():
-            daily_count = len(list(MEMORY_DIR.glob("2026-*.md")))
+            daily_count = len(_get_daily_files())
             stats['by_layer']['daily'] = daily_count
             stats['total'] += daily_count
         
         # Count knowledge graph
         if LIFE_AREAS_DIR.exists():
             kg_count = 0
-            for items_file in LIFE_AREAS_DIR.rglob("items.json"):
+            for items_file, data in _read_files(list(LIFE_AREAS_DIR.rglob("items.json"))):
                 try:
-                    with open(items_file) as f:
-                        items = json.load(f)
-                        kg_count += len(items)
+                    items = _json_loads(data)
+                    kg_count += len(items)
                 except:
                     pass
             stats['by_layer']['knowledge_graph'] = kg_count
@@ -612,11 +991,7 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
         
         # Try to get Chroma stats
         try:
-            from memory_search import MemorySearcher
-            searcher = MemorySearcher()
-            searcher._init_chroma()
-            count = searcher.collection.count()
-            stats['vector_indexed'] = count
+            stats['vector_indexed'] = _get_vector_count(self.server.state.searcher)
         except:
             stats['vector_indexed'] = 0
         
@@ -624,24 +999,68 @@ class MemoryWebHandler(BaseHTTPRequestHandler):
     
     def _extract_date(self, filename: str) -> Optional[str]:
         """Extract date from filename."""
-        import re
-        match = re.match(r'(\d{4}-\d{2}-\d{2})', filename)
-        return match.group(1) if match else None
+        # Daily notes are named YYYY-MM-DD*.md, so a fixed slice suffices
+        date = filename[:10]
+        if len(date) == 10 and date[4] == '-' and date[7] == '-' and \
+                (date[:4] + date[5:7] + date[8:]).isdecimal():
+            return date
+        return None
     
     def _serve_json(self, data: dict, status: int = 200):
         """Serve JSON response."""
+        if isinstance(data, list) and len(data) > STREAM_MIN_ITEMS:
+            self._stream_json_list(data, status)
+            return
+        
+        body = _json_dumps(data)
         self.send_response(status)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.send_header('Access-Control-Allow-Origin', '*')
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
+    
+    def _stream_json_list(self, items: list, status: int = 200):
+        """Send a JSON array in chunks of about STREAM_CHUNK_BYTES.
+        
+        Items are serialized as they are sent, so the whole body is never
+        built; grouping them keeps it to one send() per chunk, not per item.
+        """
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        
+        def frame(parts):
+            chunk = b''.join(parts)
+            return b'%x\r\n%s\r\n' % (len(chunk), chunk)
+        
+        try:
+            parts, size = [b'['], 1
+            last = len(items) - 1
+            for i, item in enumerate(items):
+                part = _json_dumps(item) + (b']' if i == last else b',')
+                parts.append(part)
+                size += len(part)
+                if size >= STREAM_CHUNK_BYTES and i != last:
+                    self.wfile.write(frame(parts))
+                    parts, size = [], 0
+        except Exception as e:
+            # Headers are already out, so the only option is to cut the response
+            self.log_error('Aborted streamed response: %s', e)
+            self.close_connection = True
+            return
+        self.wfile.write(frame(parts) + b'0\r\n\r\n')
     
     def _serve_404(self):
         """Serve 404 response."""
+        body = _json_dumps({'error': 'Not found'})
         self.send_response(404)
         self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps({'error': 'Not found'}).encode())
+        self.wfile.write(body)
 
 
 def main():
@@ -651,11 +1070,17 @@ def main():
     
     args = parser.parse_args()
     
-    server = HTTPServer((args.host, args.port), MemoryWebHandler)
+    # Loading the vector store and embedding model is the slow part of a
+    # search, so it happens once here rather than on every request
+    state = SimpleNamespace(searcher=_create_searcher(), daily_notes=DailyNotes())
+    
+    # One thread per request, so a slow search doesn't hold up stats or HTML
+    server = MemoryWebServer((args.host, args.port), MemoryWebHandler, state)
     
     print(f"🧠 Gubu's Memory Web")
     print(f"=" * 40)
     print(f"Server running at: http://{args.host}:{args.port}")
+    print(f"Search: {'vector store' if state.searcher else 'file scan (memory_search unavailable)'}")
     print(f"Press Ctrl+C to stop")
     print(f"=" * 40)
     
@@ -0,0 +1,904 @@
+#!/usr/bin/env python3
+"""
+memory_search_simple.py - Lightweight semantic search without heavy dependencies
+
+Uses scikit-learn for TF-IDF + cosine similarity instead of neural embeddings.
+Faster to install, lighter on resources, good for smaller memory collections.
+Importable as a module; memory-search-simple.py is the command-line wrapper.
+
+Usage:
+    python memory-search-simple.py "what did we discuss about AGI"
+    python memory-search-simple.py --index              # Rebuild index
+    python memory-search-simple.py --install-deps       # Install required packages
+"""
+
+import os
+import sys
+import json
+import re
+import argparse
+import bisect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from operator import attrgetter, itemgetter
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+from dataclasses import dataclass, asdict, field, fields
+import hashlib
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Configuration - Override via environment variables
+WORKSPACE_DIR = Path(os.getenv('MEMEX_WORKSPACE', Path.cwd()))
+MEMORY_DIR = WORKSPACE_DIR / "memory"
+LIFE_AREAS_DIR = Path.home() / "life" / "areas"
+MEMORY_MD = WORKSPACE_DIR / "MEMORY.md"
+AGENTS_MD = WORKSPACE_DIR / "AGENTS.md"
+HEARTBEAT_MD = WORKSPACE_DIR / "HEARTBEAT.md"
+TOOLS_DIR = WORKSPACE_DIR / "tools"
+INDEX_PATH = WORKSPACE_DIR / "tools" / "index.json"
+# The CSR matrix is saved as its three flat arrays so they can be memory-mapped
+INDEX_ARRAY_PATHS = tuple(
+    INDEX_PATH.with_name(f"{INDEX_PATH.stem}_{part}.npy") for part in ('data', 'indices', 'indptr')
+)
+INDEX_ENTRIES_PATH = INDEX_PATH.with_suffix('.jsonl')
+INDEX_READ_WORKERS = 16
+# Bumped whenever saved indexes can't be reused (e.g. the ID scheme changed)
+INDEX_VERSION = 4
+
+# Tacit sections and skill files longer than CHUNK_THRESHOLD characters are
+# indexed as overlapping chunks, so one huge row can't dominate the scores
+CHUNK_THRESHOLD = 3000
+CHUNK_CHARS = 1500
+CHUNK_OVERLAP = 200
+
+# Markdown sections start at an h1-h3 heading; daily notes are named by date
+_SECTION_RE = re.compile(r'\n(?=#{1,3}\s)')
+_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+
+# Vectorizer settings, shared by index_all and load_index. Terms are hashed
+# into a fixed feature space, so there is no vocabulary to build or store.
+HASHING_PARAMS = dict(
+    n_features=2 ** 18,
+    stop_words='english',
+    ngram_range=(1, 2),
+    alternate_sign=False,
+    norm=None
+)
+TFIDF_PARAMS = dict(
+    sublinear_tf=True
+)
+
+
+def _json_loads(data: bytes):
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@contextmanager
+def _replacing(path: Path, mode: str):
+    """Open a temp file next to path and rename it over path on success."""
+    tmp = path.with_name(f'.{path.name}.{os.getpid()}.tmp')
+    try:
+        with open(tmp, mode, encoding=None if 'b' in mode else 'utf-8') as f:
+            yield f
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+def build_vectorizer():
+    """Create the (unfitted) hashing + TF-IDF pipeline used for the index.
+    
+    Features are float32: half the matrix size on disk and in memory, and
+    half the bandwidth per query product, at no cost to ranking.
+    """
+    import numpy as np
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline
+    
+    return make_pipeline(
+        HashingVectorizer(dtype=np.float32, **HASHING_PARAMS),
+        TfidfTransformer(**TFIDF_PARAMS)
+    )
+
+# slots=True needs Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
+class MemoryEntry:
+    """A single memory entry with metadata."""
+    id: str
+    content: str
+    source: str
+    layer: str
+    timestamp: Optional[str] = None
+    entity: Optional[str] = None
+    category: Optional[str] = None
+    # Character offset within the section/file this chunk was cut from;
+    # None for entries that hold their whole text
+    chunk_offset: Optional[int] = None
+    
+    @classmethod
+    def generate_id(cls, content: str, source: str) -> str:
+        hash_input = f"{source}:{content[:200]}"
+        return hashlib.blake2b(hash_input.encode(), digest_size=6).hexdigest()
+
+
+def _chunk_text(content: str, chunk_chars: int = CHUNK_CHARS, overlap: int = CHUNK_OVERLAP) -> Iterator[Tuple[int, str]]:
+    """Yield (offset, chunk) windows of at most chunk_chars characters.
+    
+    Windows end at a paragraph break where possible and start at the first
+    break within `overlap` characters of the previous window's end, so
+    neighbouring chunks share whole paragraphs. A paragraph longer than a
+    window is cut mid-text with a plain character overlap.
+    """
+    breaks = [0] + [m.end() for m in _PARAGRAPH_RE.finditer(content)] + [len(content)]
+    
+    start = 0
+    while start < len(content):
+        i = bisect.bisect_right(breaks, start + chunk_chars) - 1
+        end = breaks[i] if breaks[i] > start else min(start + chunk_chars, len(content))
+        
+        chunk = content[start:end].strip()
+        if chunk:
+            yield start, chunk
+        if end >= len(content):
+            break
+        
+        j = bisect.bisect_left(breaks, end - overlap)
+        if start < breaks[j] < end:
+            start = breaks[j]
+        elif breaks[i] == end:
+            start = end
+        else:
+            start = max(end - overlap, start + 1)
+
+
+# MemoryEntry fields in declaration order, as read from entries and saved rows
+_ENTRY_FIELDS = tuple(f.name for f in fields(MemoryEntry))
+_entry_row = attrgetter(*_ENTRY_FIELDS)
+_saved_row = itemgetter(*_ENTRY_FIELDS)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
+class MemoryTable:
+    """Index entries stored column-wise, one NumPy array per MemoryEntry field.
+    
+    Filters compare whole columns at once; MemoryEntry objects are only
+    rebuilt for the rows a caller actually returns. Missing optional values
+    are stored as '' (or -1 for chunk_offset) so the columns stay plain
+    string/int arrays.
+    """
+    ids: 'np.ndarray'
+    contents: 'np.ndarray'
+    sources: 'np.ndarray'
+    layers: 'np.ndarray'
+    timestamps: 'np.ndarray'
+    entities: 'np.ndarray'
+    categories: 'np.ndarray'
+    chunk_offsets: 'np.ndarray'
+    # Memoized rows_by() results, keyed by column name
+    _groups: Dict[str, Dict[str, 'np.ndarray']] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple]) -> 'MemoryTable':
+        """Build a table from tuples of MemoryEntry field values."""
+        import numpy as np
+        
+        columns = list(zip(*rows)) or [()] * len(_ENTRY_FIELDS)
+        ids, contents, sources, layers, timestamps, entities, categories, chunk_offsets = columns
+        
+        def optional(values):
+            return [v or '' for v in values]
+        
+        # Short fields become fixed-width strings; free text stays as objects
+        return cls(
+            ids=np.array(ids, dtype=str),
+            contents=np.array(contents, dtype=object),
+            sources=np.array(sources, dtype=str),
+            layers=np.array(layers, dtype=str),
+            timestamps=np.array(optional(timestamps), dtype=str),
+            entities=np.array(optional(entities), dtype=str),
+            categories=np.array(optional(categories), dtype=object),
+            chunk_offsets=np.array([-1 if o is None else o for o in chunk_offsets], dtype=np.int64)
+        )
+    
+    @classmethod
+    def from_entries(cls, entries: Iterable[MemoryEntry]) -> 'MemoryTable':
+        return cls.from_rows(map(_entry_row, entries))
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        return map(self.entry, range(len(self)))
+    
+    def rows_by(self, column: str) -> Dict[str, 'np.ndarray']:
+        """Sorted row numbers for each distinct value of column, built once."""
+        import numpy as np
+        
+        groups = self._groups.get(column)
+        if groups is None:
+            values, inverse = np.unique(getattr(self, column), return_inverse=True)
+            order = np.argsort(inverse, kind='stable')
+            bounds = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+            groups = dict(zip(values.tolist(), np.split(order, bounds)))
+            self._groups[column] = groups
+        return groups
+    
+    def entry(self, i: int) -> MemoryEntry:
+        """Rebuild the MemoryEntry at row i."""
+        return MemoryEntry(
+            id=str(self.ids[i]),
+            content=self.contents[i],
+            source=str(self.sources[i]),
+            layer=str(self.layers[i]),
+            timestamp=str(self.timestamps[i]) or None,
+            entity=str(self.entities[i]) or None,
+            category=self.categories[i] or None,
+            chunk_offset=None if self.chunk_offsets[i] < 0 else int(self.chunk_offsets[i])
+        )
+
+
+class SimpleMemoryIndexer:
+    """Simple indexer using TF-IDF + cosine similarity."""
+    
+    def __init__(self):
+        self.table: Optional[MemoryTable] = None
+        self.vectorizer = None
+        self.matrix = None
+        self._idf_meta: Dict = {}
+        self._matrix_shape: Tuple[int, int] = (0, 0)
+        # Per-file (mtime_ns, size) of every source file, used to skip
+        # re-parsing files that haven't changed since the last index
+        self.file_stats: Dict[str, Tuple[int, int]] = {}
+        self._previous_stats: Dict[str, Tuple[int, int]] = {}
+        self._previous_entries: Dict[str, List[MemoryEntry]] = {}
+        self._reparsed = 0
+        self._stats_lock = threading.Lock()
+        
+    def has_sklearn(self) -> bool:
+        """Check if sklearn is available."""
+        try:
+            from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+            return True
+        except ImportError:
+            return False
+    
+    def install_deps(self):
+        """Install required dependencies."""
+        print("Installing scikit-learn...")
+        os.system("pip install scikit-learn --quiet")
+        print("✅ Dependencies installed. Please restart.")
+        
+    def index_all(self, force_reindex: bool = False):
+        """Index all memory sources.
+        
+        Files whose mtime and size match the previous index reuse their
+        stored entries; --force re-reads everything.
+        """
+        print("🔍 Indexing memories (TF-IDF mode)...")
+        
+        # Only what this run loads from disk may be reused; a previous
+        # index_all() on this indexer must not leak old entries back in
+        self._previous_stats = {}
+        self._previous_entries = {}
+        previous_ids = None
+        if not force_reindex and self.load_index():
+            previous_ids = self.table.ids.tolist()
+            self._previous_stats = self.file_stats
+            for entry in self.table:
+                self._previous_entries.setdefault(entry.source, []).append(entry)
+        
+        self.file_stats = {}
+        self._reparsed = 0
+        
+        sources = [
+            ("📅 Daily notes", self._index_daily_notes),
+            ("🧠 Tacit knowledge", self._index_tacit_knowledge),
+            ("🕸️  Knowledge graph", self._index_knowledge_graph),
+            ("🛠️  Tools/skills", self._index_tools),
+        ]
+        
+        # Walk the sources concurrently and overlap their file reads on a
+        # shared pool; results are collected in source order
+        entries = []
+        with ThreadPoolExecutor(max_workers=INDEX_READ_WORKERS) as file_pool, \
+                ThreadPoolExecutor(max_workers=len(sources)) as source_pool:
+            futures = [source_pool.submit(index, file_pool) for _, index in sources]
+            for (label, _), future in zip(sources, futures):
+                source_entries = future.result()
+                print(f"  {label}: {len(source_entries)} entries")
+                entries.extend(source_entries)
+        
+        # Drop exact repeats (e.g. a section pasted twice into one note).
+        # MemoryEntry is frozen, so whole entries hash; comparing IDs alone
+        # would merge distinct items.json facts that happen to share an ID.
+        unique_entries = list(dict.fromkeys(entries))
+        if len(unique_entries) < len(entries):
+            print(f"  ♻️  Skipped {len(entries) - len(unique_entries)} duplicate entries")
+            entries = unique_entries
+        
+        if not entries:
+            print("⚠️  No entries to index")
+            return 0
+        
+        # Nothing added, changed or removed - the saved matrix is still valid
+        unchanged = (
+            previous_ids is not None
+            and self._reparsed == 0
+            and self.file_stats.keys() == self._previous_stats.keys()
+            and [e.id for e in entries] == previous_ids
+        )
+        if unchanged:
+            print(f"✅ Index up to date ({len(entries)} memories)")
+            return len(entries)
+        
+        # Checked only now, so an up-to-date index never imports sklearn
+        if not self.has_sklearn():
+            print("❌ scikit-learn not installed.")
+            print("Run: python memory-search-simple.py --install-deps")
+            return 0
+        
+        self.table = MemoryTable.from_entries(entries)
+        
+        # Build TF-IDF matrix
+        self.vectorizer = build_vectorizer()
+        self.matrix = self.vectorizer.fit_transform(self.table.contents)
+        
+        # Save index
+        self._save_index()
+        
+        print(f"✅ Indexed {len(self.table)} memories ({self._reparsed} files re-read)")
+        print(f"   Features used: {len(set(self.matrix.indices))}")
+        return len(self.table)
+    
+    def _cached_entries(self, file_path: Path, parse: Callable[[], List[MemoryEntry]]) -> List[MemoryEntry]:
+        """Return entries for file_path, calling parse() only if it changed."""
+        st = file_path.stat()
+        key = str(file_path)
+        stat = (st.st_mtime_ns, st.st_size)
+        
+        if self._previous_stats.get(key) == stat:
+            entries = self._previous_entries.get(key, [])
+        else:
+            entries = parse()
+            with self._stats_lock:
+                self._reparsed += 1
+        
+        self.file_stats[key] = stat
+        return entries
+    
+    def _read_files(self, pool: ThreadPoolExecutor, jobs: List[Tuple[Path, Callable[[], List[MemoryEntry]]]]) -> List[MemoryEntry]:
+        """Run _cached_entries for each (file, parse) job on pool, keeping job order."""
+        def read(job):
+            file_path, parse = job
+            try:
+                return self._cached_entries(file_path, parse)
+            except Exception as e:
+                print(f"  ⚠️  Error reading {file_path}: {e}")
+                return []
+        
+        entries = []
+        for file_entries in pool.map(read, jobs):
+            entries.extend(file_entries)
+        return entries
+    
+    def _index_daily_notes(self, pool: ThreadPoolExecutor) -> List[MemoryEntry]:
+        """Index daily memory notes."""
+        if not MEMORY_DIR.exists():
+            return []
+        
+        jobs = []
+        for file_path in sorted(MEMORY_DIR.glob("*.md")):
+            # Skip summaries directory
+            if file_path.is_dir():
+                continue
+            jobs.append((file_path, partial(self._parse_daily_note, file_path)))
+        
+        return self._read_files(pool, jobs)
+    
+    def _parse_daily_note(self, file_path: Path) -> List[MemoryEntry]:
+        """Split a daily note into one entry per section."""
+        content = file_path.read_text(encoding='utf-8')
+        source = str(file_path)
+        timestamp = self._extract_date_from_filename(file_path.name)
+        
+        # Sections come back stripped, so their length is the content length
+        return [
+            MemoryEntry(
+                id=MemoryEntry.generate_id(section, source),
+                content=section,
+                source=source,
+                layer="daily",
+                timestamp=timestamp,
+                category=self._extract_category_from_section(section)
+            )
+            for section in self._split_by_sections(content)
+            if len(section) >= 50
+        ]
+    
+    def _index_tacit_knowledge(self, pool: ThreadPoolExecutor) -> List[MemoryEntry]:
+        """Index tacit knowledge files."""
+        tacit_files = [MEMORY_MD, AGENTS_MD, HEARTBEAT_MD]
+        
+        jobs = [
+            (file_path, partial(self._parse_tacit_file, file_path))
+            for file_path in tacit_files
+            if file_path.exists()
+        ]
+        return self._read_files(pool, jobs)
+    
+    def _parse_tacit_file(self, file_path: Path) -> List[MemoryEntry]:
+        """Split a tacit knowledge file into one entry per section."""
+        content = file_path.read_text(encoding='utf-8')
+        source = str(file_path)
+        
+        return [
+            entry
+            for section in self._split_by_sections(content)
+            if len(section) >= 30
+            for entry in self._chunk_entries(
+                section, source,
+                layer="tacit",
+                category=self._extract_category_from_section(section)
+            )
+        ]
+    
+    def _index_knowledge_graph(self, pool: ThreadPoolExecutor) -> List[MemoryEntry]:
+        """Index knowledge graph."""
+        if not LIFE_AREAS_DIR.exists():
+            return []
+        
+        jobs = []
+        
+        for area_type in ['people', 'companies', 'projects', 'skills', 'workflows']:
+            area_dir = LIFE_AREAS_DIR / area_type
+            if not area_dir.exists():
+                continue
+                
+            for entity_dir in area_dir.iterdir():
+                if not entity_dir.is_dir():
+                    continue
+                    
+                entity_name = entity_dir.name
+                
+                summary_file = entity_dir / "summary.md"
+                if summary_file.exists():
+                    jobs.append((
+                        summary_file,
+                        partial(self._parse_entity_summary, summary_file, entity_name, area_type)
+                    ))
+                
+                items_file = entity_dir / "items.json"
+                if items_file.exists():
+                    jobs.append((items_file, partial(self._parse_entity_items, items_file, entity_name)))
+        
+        return self._read_files(pool, jobs)
+    
+    def _parse_entity_summary(self, summary_file: Path, entity_name: str, area_type: str) -> List[MemoryEntry]:
+        """Index an entity's summary.md as a single entry."""
+        content = summary_file.read_text(encoding='utf-8')
+        return [MemoryEntry(
+            id=MemoryEntry.generate_id(content, str(summary_file)),
+            content=content,
+            source=str(summary_file),
+            layer="knowledge_graph",
+            entity=entity_name,
+            category=f"summary:{area_type}"
+        )]
+    
+    def _parse_entity_items(self, items_file: Path, entity_name: str) -> List[MemoryEntry]:
+        """Index each fact in an entity's items.json."""
+        entries = []
+        items = _json_loads(items_file.read_bytes())
+        
+        # Handle both list and dict formats
+        if isinstance(items, dict):
+            items = items.get('items', [])
+        
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            fact_text = item.get('fact', '')
+            if not fact_text:
+                continue
+                
+            entry = MemoryEntry(
+                id=item.get('id', MemoryEntry.generate_id(fact_text, str(items_file))),
+                content=fact_text,
+                source=str(items_file),
+                layer="knowledge_graph",
+                entity=entity_name,
+                timestamp=item.get('timestamp'),
+                category=item.get('category', 'fact')
+            )
+            entries.append(entry)
+        
+        return entries
+    
+    def _index_tools(self, pool: ThreadPoolExecutor) -> List[MemoryEntry]:
+        """Index tool documentation."""
+        if not TOOLS_DIR.exists():
+            return []
+        
+        jobs = [
+            (skill_file, partial(self._parse_skill_file, skill_file))
+            for skill_file in TOOLS_DIR.rglob("SKILL.md")
+        ]
+        return self._read_files(pool, jobs)
+    
+    def _parse_skill_file(self, skill_file: Path) -> List[MemoryEntry]:
+        """Index a SKILL.md as a single entry (or chunks, if it is long)."""
+        content = skill_file.read_text(encoding='utf-8')
+        return self._chunk_entries(content, str(skill_file), layer="tools", category="skill")
+    
+    def _chunk_entries(self, text: str, source: str, **metadata) -> List[MemoryEntry]:
+        """One entry for text, or one per chunk when it exceeds CHUNK_THRESHOLD."""
+        if len(text) <= CHUNK_THRESHOLD:
+            return [MemoryEntry(
+                id=MemoryEntry.generate_id(text, source),
+                content=text,
+                source=source,
+                **metadata
+            )]
+        
+        # Chunks overlap, so the offset keeps their IDs distinct and stable
+        return [
+            MemoryEntry(
+                id=MemoryEntry.generate_id(chunk, f"{source}@{offset}"),
+                content=chunk,
+                source=source,
+                chunk_offset=offset,
+                **metadata
+            )
+            for offset, chunk in _chunk_text(text)
+        ]
+    
+    def _split_by_sections(self, content: str) -> List[str]:
+        """Split markdown content into sections."""
+        parts = _SECTION_RE.split(content)
+        return [section for section in map(str.strip, parts) if section]
+    
+    def _extract_date_from_filename(self, filename: str) -> Optional[str]:
+        """Extract date from filename."""
+        match = _DATE_RE.match(filename)
+        return match.group(1) if match else None
+    
+    def _extract_category_from_section(self, section: str) -> Optional[str]:
+        """Extract category from section header."""
+        lines = section.split('\n')
+        for line in lines[:3]:
+            if line.startswith('#'):
+                return line.lstrip('#').strip().lower()
+        return None
+    
+    def _save_index(self):
+        """Save index to disk.
+        
+        The sparse matrix goes to three flat .npy arrays (INDEX_ARRAY_PATHS),
+        entries are streamed one JSON object per line, and the fitted IDF
+        weights, matrix shape and file stats live in the JSON sidecar at
+        INDEX_PATH. The sidecar is removed first and written last, so its
+        presence marks a complete index; every file is written under a temp
+        name and renamed into place, so a process that has the old arrays
+        mapped keeps reading intact files.
+        """
+        import numpy as np
+        
+        INDEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            INDEX_PATH.unlink()
+        except FileNotFoundError:
+            pass
+        
+        matrix = self.matrix.tocsr()
+        for path, array in zip(INDEX_ARRAY_PATHS, (matrix.data, matrix.indices, matrix.indptr)):
+            with _replacing(path, 'wb') as f:
+                np.save(f, array)
+        
+        with _replacing(INDEX_ENTRIES_PATH, 'w') as f:
+            for entry in self.table:
+                f.write(json.dumps(asdict(entry)) + '\n')
+        
+        index_meta = {
+            'version': INDEX_VERSION,
+            'idf': self._sparse_idf(),
+            'matrix_shape': list(matrix.shape),
+            'file_stats': self.file_stats,
+            'indexed_at': datetime.now().isoformat()
+        }
+        
+        with _replacing(INDEX_PATH, 'w') as f:
+            json.dump(index_meta, f)
+    
+    def _sparse_idf(self) -> Dict:
+        """IDF weights for the features that occur in the corpus.
+        
+        Only those columns of the 2**18-wide hash space are stored. Features
+        the corpus never saw load with weight 0, so unknown query terms are
+        ignored just like out-of-vocabulary words in a fitted vocabulary.
+        """
+        import numpy as np
+        
+        idf = self.vectorizer[-1].idf_
+        columns = np.unique(self.matrix.indices)
+        return {
+            'columns': columns.tolist(),
+            'values': idf[columns].tolist()
+        }
+    
+    def load_index(self) -> bool:
+        """Load index entries and metadata from disk.
+        
+        The vectorizer and matrix are left to load_model(), so lookups that
+        only need entries (--ids, timeline --id) never import sklearn/scipy.
+        """
+        if not INDEX_PATH.exists():
+            return False
+        
+        try:
+            with open(INDEX_PATH, encoding='utf-8') as f:
+                index_meta = json.load(f)
+            if index_meta.get('version') != INDEX_VERSION:
+                return False
+            
+            with open(INDEX_ENTRIES_PATH, encoding='utf-8') as f:
+                self.table = MemoryTable.from_rows(_saved_row(json.loads(line)) for line in f)
+            
+            self._idf_meta = index_meta['idf']
+            self._matrix_shape = tuple(index_meta['matrix_shape'])
+            if self._matrix_shape[0] != len(self.table):
+                # Entries from a different build than the metadata
+                return False
+            self.vectorizer = self.matrix = None
+            self.file_stats = {k: tuple(v) for k, v in index_meta.get('file_stats', {}).items()}
+            return True
+        except Exception as e:
+            print(f"⚠️  Error loading index: {e}")
+            return False
+    
+    def load_model(self):
+        """Load the fitted vectorizer and TF-IDF matrix of a loaded index."""
+        if self.matrix is not None:
+            return
+        
+        import numpy as np
+        import scipy.sparse
+        
+        # The hasher is stateless; the TF-IDF step only needs its weights
+        idf = np.zeros(HASHING_PARAMS['n_features'], dtype=np.float32)
+        idf[self._idf_meta['columns']] = self._idf_meta['values']
+        self.vectorizer = build_vectorizer()
+        self.vectorizer[-1].idf_ = idf
+        
+        # Map the arrays instead of reading them: the OS pages in only the
+        # rows a search actually touches
+        data, indices, indptr = (np.load(path, mmap_mode='r') for path in INDEX_ARRAY_PATHS)
+        self.matrix = scipy.sparse.csr_matrix((data, indices, indptr), shape=self._matrix_shape)
+
+
+class SimpleMemorySearcher:
+    """Search using TF-IDF similarity."""
+    
+    def __init__(self):
+        self.indexer = SimpleMemoryIndexer()
+        
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        layer: Optional[str] = None,
+        since: Optional[str] = None,
+        entity: Optional[str] = None
+    ) -> List[Dict]:
+        """Search memories."""
+        
+        if not self.indexer.load_index():
+            print("⚠️  No index found. Building...")
+            self.indexer.index_all()
+            self.indexer.load_index()
+        self.indexer.load_model()
+        
+        import numpy as np
+        
+        indexer = self.indexer
+        table = indexer.table
+        
+        # Apply filters: layer and entity come from the memoized row groups,
+        # so only `since` needs a pass over the remaining candidates
+        no_rows = np.empty(0, dtype=np.intp)
+        candidates = np.arange(len(table))
+        if layer:
+            candidates = table.rows_by('layers').get(layer, no_rows)
+        if entity:
+            candidates = np.intersect1d(candidates, table.rows_by('entities').get(entity, no_rows))
+        if since:
+            timestamps = table.timestamps[candidates]
+            candidates = candidates[(timestamps == '') | (timestamps >= since)]
+        if limit <= 0 or not len(candidates):
+            return []
+        
+        # Vectorize query
+        query_vec = indexer.vectorizer.transform([query])
+        
+        # Unfiltered searches use the memory-mapped matrix as is, without copying
+        rows = indexer.matrix if len(candidates) == len(table) else indexer.matrix[candidates]
+        
+        # Rows and query are both L2-normalized, so a dot product is the cosine
+        similarities = (rows @ query_vec.T).toarray().ravel()
+        
+        # Select the top `limit` without sorting every candidate
+        if limit < len(candidates):
+            top = np.argpartition(-similarities, limit - 1)[:limit]
+        else:
+            top = np.arange(len(candidates))
+        top = top[np.argsort(-similarities[top], kind='stable')]
+        
+        results = []
+        for i in top:
+            entry = table.entry(candidates[i])
+            results.append({
+                'id': entry.id,
+                'content': entry.content,
+                'metadata': {
+                    'source': entry.source,
+                    'layer': entry.layer,
+                    'timestamp': entry.timestamp or '',
+                    'entity': entry.entity or '',
+                    'category': entry.category or ''
+                },
+                'relevance': float(similarities[i])
+            })
+        
+        return results
+
+
+def print_index(results: List[Dict]):
+    """Print index-only results (ID + preview for progressive disclosure)."""
+    if not results:
+        print("\n❌ No memories found.")
+        return
+    
+    print(f"\n📇 Index: {len(results)} results (IDs only)\n")
+    
+    layer_emoji = {
+        'daily': '📅',
+        'tacit': '🧠',
+        'knowledge_graph': '🕸️',
+        'tools': '🛠️'
+    }
+    
+    ids = []
+    for i, r in enumerate(results, 1):
+        emoji = layer_emoji.get(r['metadata']['layer'], '📝')
+        preview = r['content'][:80].replace('\n', ' ')
+        
+        print(f"{i}. [{emoji}] {preview}...")
+        print(f"   ID: {r['id']}")
+        ids.append(r['id'])
+    
+    print(f"\n💡 Get full details: python memory-search-simple.py --ids {','.join(ids[:3])}")
+    print(f"   Token savings: ~90% (showing previews only)")
+
+def print_results(results: List[Dict]):
+    """Print search results."""
+    if not results:
+        print("\n❌ No memories found.")
+        return
+    
+    print(f"\n🔍 Found {len(results)} relevant memories:\n")
+    
+    layer_emoji = {
+        'daily': '📅',
+        'tacit': '🧠',
+        'knowledge_graph': '🕸️',
+        'tools': '🛠️'
+    }
+    
+    for i, r in enumerate(results, 1):
+        emoji = layer_emoji.get(r['metadata']['layer'], '📝')
+        preview = r['content'][:150] + '...' if len(r['content']) > 150 else r['content']
+        
+        print(f"{i}. [{emoji}] {preview[:100]}")
+        print(f"   ID: {r['id']} | Source: {os.path.basename(r['metadata']['source'])}")
+        if r['metadata'].get('timestamp'):
+            print(f"   Date: {r['metadata']['timestamp']}")
+        print(f"   Relevance: {r['relevance']:.3f}")
+        print()
+    
+    print(f"💡 Cite by ID: mem-{results[0]['id']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simple semantic search for memories")
+    parser.add_argument('query', nargs='?', help='Search query')
+    parser.add_argument('--index', action='store_true', help='Rebuild index')
+    parser.add_argument('--install-deps', action='store_true', help='Install dependencies')
+    parser.add_argument('--limit', '-n', type=int, default=10)
+    parser.add_argument('--layer', choices=['daily', 'tacit', 'knowledge_graph', 'tools'])
+    parser.add_argument('--since', help='Filter by date (YYYY-MM-DD)')
+    parser.add_argument('--entity', help='Filter by entity name')
+    parser.add_argument('--force', action='store_true', help='Force reindex')
+    parser.add_argument('--ids', help='Get full details for specific IDs (comma-separated, e.g. abc123,def456)')
+    parser.add_argument('--format', choices=['full', 'index'], default='full', help='Output format: full (default) or index (ID + preview only)')
+    
+    args = parser.parse_args()
+    
+    if args.install_deps:
+        SimpleMemoryIndexer().install_deps()
+        return
+    
+    if args.index:
+        indexer = SimpleMemoryIndexer()
+        count = indexer.index_all(force_reindex=args.force)
+        print(f"\n✅ Indexed {count} memories")
+        return
+    
+    # Handle ID-based lookup
+    if args.ids:
+        searcher = SimpleMemorySearcher()
+        if not searcher.indexer.load_index():
+            print("❌ No index found. Run --index first.")
+            sys.exit(1)
+        
+        requested_ids = dict.fromkeys(id.strip() for id in args.ids.split(','))
+        table = searcher.indexer.table
+        # items.json may reuse IDs, so each ID maps to a group of rows
+        by_id = table.rows_by('ids')
+        rows = sorted(i for rid in requested_ids for i in by_id.get(rid, ()))
+        results = []
+        
+        for i in rows:
+            entry = table.entry(i)
+            results.append({
+                'id': entry.id,
+                'content': entry.content,
+                'metadata': {
+                    'source': entry.source,
+                    'layer': entry.layer,
+                    'timestamp': entry.timestamp or '',
+                    'entity': entry.entity or '',
+                    'category': entry.category or ''
+                },
+                'relevance': 1.0  # Direct lookup, always 100% relevant
+            })
+        
+        print_results(results)
+        return
+    
+    if not args.query:
+        parser.print_help()
+        print("\n❌ Query required (or use --index or --ids)")
+        sys.exit(1)
+    
+    searcher = SimpleMemorySearcher()
+    results = searcher.search(
+        query=args.query,
+        limit=args.limit,
+        layer=args.layer,
+        since=args.since,
+        entity=args.entity
+    )
+    
+    if args.format == 'index':
+        print_index(results)
+    else:
+        print_results(results)
+
+
+if __name__ == '__main__':
+    main()